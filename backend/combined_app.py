@@ -0,0 +1,9 @@
+from common import calibrate_bcrypt_rounds, create_app
+from auth_app import auth_bp, init_db
+from user_app import users_bp
+
+if __name__ == '__main__':
+    app = create_app('all', [auth_bp, users_bp])
+    calibrate_bcrypt_rounds(app)
+    init_db(app)
+    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file